@@ -169,6 +169,18 @@ async def handle_reset(self, message: GroupChatReset, ctx: MessageContext) -> No
         # Reset the group chat manager.
         await self.reset()
 
+    def _construct_roles(self) -> str:
+        """Construct the description of the participants, one line per participant.
+        The participant topic type is used as the agent name."""
+        return "\n".join(
+            [
+                f"{topic_type}: {description}".strip()
+                for topic_type, description in zip(
+                    self._participant_topic_types, self._participant_descriptions, strict=True
+                )
+            ]
+        )
+
     @abstractmethod
     async def validate_group_state(self, messages: List[ChatMessage] | None) -> None:
         """Validate the state of the group chat given the start messages.
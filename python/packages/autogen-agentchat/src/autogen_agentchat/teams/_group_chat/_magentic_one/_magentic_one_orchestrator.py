@@ -1,6 +1,5 @@
-import json
 import logging
-from typing import Any, Dict, List, Mapping
+from typing import Any, List, Mapping
 
 from autogen_core import AgentId, CancellationToken, DefaultTopicId, Image, MessageContext, event, rpc
 from autogen_core.models import (
@@ -9,6 +8,7 @@
     LLMMessage,
     UserMessage,
 )
+from pydantic import BaseModel, ValidationError
 
 from .... import TRACE_LOGGER_NAME
 from ....base import Response, TerminationCondition
@@ -46,6 +46,26 @@
 trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
 
 
+class _BoolLedgerEntry(BaseModel):
+    reason: str
+    answer: bool
+
+
+class _StrLedgerEntry(BaseModel):
+    reason: str
+    answer: str
+
+
+class _ProgressLedger(BaseModel):
+    """The schema of the progress ledger, see ORCHESTRATOR_PROGRESS_LEDGER_PROMPT."""
+
+    is_request_satisfied: _BoolLedgerEntry
+    is_in_loop: _BoolLedgerEntry
+    is_progress_being_made: _BoolLedgerEntry
+    next_speaker: _StrLedgerEntry
+    instruction_or_question: _StrLedgerEntry
+
+
 class MagenticOneOrchestrator(BaseGroupChatManager):
     """The MagenticOneOrchestrator manages a group chat with ledger based orchestration."""
 
@@ -79,14 +99,8 @@ def __init__(
         self._plan = ""
         self._n_rounds = 0
         self._n_stalls = 0
-        self._team_description = "\n".join(
-            [
-                f"{topic_type}: {description}".strip()
-                for topic_type, description in zip(
-                    self._participant_topic_types, self._participant_descriptions, strict=True
-                )
-            ]
-        )
+        self._participant_topic_type_set = frozenset(self._participant_topic_types)
+        self._team_description = self._construct_roles()
 
     def _get_task_ledger_facts_prompt(self, task: str) -> str:
         return ORCHESTRATOR_TASK_LEDGER_FACTS_PROMPT.format(task=task)
@@ -277,52 +291,33 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
             self._task, self._team_description, self._participant_topic_types
         )
         context.append(UserMessage(content=progress_ledger_prompt, source=self._name))
-        progress_ledger: Dict[str, Any] = {}
+        progress_ledger: _ProgressLedger | None = None
         assert self._max_json_retries > 0
-        key_error: bool = False
         for _ in range(self._max_json_retries):
             response = await self._model_client.create(context, json_output=True)
             ledger_str = response.content
-            try:
-                assert isinstance(ledger_str, str)
-                progress_ledger = json.loads(ledger_str)
-                required_keys = [
-                    "is_request_satisfied",
-                    "is_progress_being_made",
-                    "is_in_loop",
-                    "instruction_or_question",
-                    "next_speaker",
-                ]
-                key_error = False
-                for key in required_keys:
-                    if (
-                        key not in progress_ledger
-                        or not isinstance(progress_ledger[key], dict)
-                        or "answer" not in progress_ledger[key]
-                        or "reason" not in progress_ledger[key]
-                    ):
-                        key_error = True
-                        break
-                if not key_error:
-                    break
-                await self._log_message(f"Failed to parse ledger information, retrying: {ledger_str}")
-            except (json.JSONDecodeError, TypeError):
-                key_error = True
+            if not isinstance(ledger_str, str):
                 await self._log_message("Invalid ledger format encountered, retrying...")
                 continue
-        if key_error:
+            try:
+                # Parse and validate the ledger against its schema in one step.
+                progress_ledger = _ProgressLedger.model_validate_json(ledger_str)
+                break
+            except ValidationError:
+                await self._log_message(f"Failed to parse ledger information, retrying: {ledger_str}")
+        if progress_ledger is None:
             raise ValueError("Failed to parse ledger information after multiple retries.")
-        await self._log_message(f"Progress Ledger: {progress_ledger}")
+        await self._log_message(f"Progress Ledger: {progress_ledger.model_dump()}")
         # Check for task completion
-        if progress_ledger["is_request_satisfied"]["answer"]:
+        if progress_ledger.is_request_satisfied.answer:
             await self._log_message("Task completed, preparing final answer...")
-            await self._prepare_final_answer(progress_ledger["is_request_satisfied"]["reason"], cancellation_token)
+            await self._prepare_final_answer(progress_ledger.is_request_satisfied.reason, cancellation_token)
             return
 
         # Check for stalling
-        if not progress_ledger["is_progress_being_made"]["answer"]:
+        if not progress_ledger.is_progress_being_made.answer:
             self._n_stalls += 1
-        elif progress_ledger["is_in_loop"]["answer"]:
+        elif progress_ledger.is_in_loop.answer:
             self._n_stalls += 1
         else:
             self._n_stalls = max(0, self._n_stalls - 1)
@@ -335,11 +330,11 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
             return
 
         # Broadcast the next step
-        message = TextMessage(content=progress_ledger["instruction_or_question"]["answer"], source=self._name)
+        message = TextMessage(content=progress_ledger.instruction_or_question.answer, source=self._name)
         self._message_thread.append(message)  # My copy
 
         # Log it
-        await self._log_message(f"Next Speaker: {progress_ledger['next_speaker']['answer']}")
+        await self._log_message(f"Next Speaker: {progress_ledger.next_speaker.answer}")
         await self.publish_message(
             GroupChatMessage(message=message),
             topic_id=DefaultTopicId(type=self._output_topic_type),
@@ -353,21 +348,16 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
         )
 
         # Request that the step be completed
-        valid_next_speaker: bool = False
-        next_speaker = progress_ledger["next_speaker"]["answer"]
-        for participant_topic_type in self._participant_topic_types:
-            if participant_topic_type == next_speaker:
-                await self.publish_message(
-                    GroupChatRequestPublish(),
-                    topic_id=DefaultTopicId(type=next_speaker),
-                    cancellation_token=cancellation_token,
-                )
-                valid_next_speaker = True
-                break
-        if not valid_next_speaker:
+        next_speaker = progress_ledger.next_speaker.answer
+        if next_speaker not in self._participant_topic_type_set:
             raise ValueError(
                 f"Invalid next speaker: {next_speaker} from the ledger, participants are: {self._participant_topic_types}"
             )
+        await self.publish_message(
+            GroupChatRequestPublish(),
+            topic_id=DefaultTopicId(type=next_speaker),
+            cancellation_token=cancellation_token,
+        )
 
     async def _update_task_ledger(self, cancellation_token: CancellationToken) -> None:
         """Update the task ledger (outer loop) with the latest facts and plan."""
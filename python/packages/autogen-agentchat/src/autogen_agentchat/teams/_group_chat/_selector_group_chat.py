@@ -1,6 +1,8 @@
 import logging
 import re
-from typing import Any, Callable, Dict, List, Mapping, Sequence
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
 
 from autogen_core.models import ChatCompletionClient, SystemMessage
 
@@ -19,6 +21,22 @@
 trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
 
 
+@lru_cache(maxsize=256)
+def _agent_mention_pattern(agent_names: Tuple[str, ...]) -> Tuple[re.Pattern[str], Dict[str, str]]:
+    """Compiles a single pattern that finds mentions of any of the agent names, taking word boundaries
+    into account. Accommodates escaping underscores and underscores as spaces.
+
+    Returns the compiled pattern and a mapping from each matched variant to its agent name."""
+    variant_to_name: Dict[str, str] = {}
+    for name in agent_names:
+        for variant in (name, name.replace("_", " "), name.replace("_", r"\_")):
+            variant_to_name.setdefault(variant, name)
+    # Try longer variants first so that a name is not shadowed by another name that is its prefix.
+    variants = sorted(variant_to_name, key=len, reverse=True)
+    pattern = re.compile(r"(?<=\W)(" + "|".join(re.escape(variant) for variant in variants) + r")(?=\W)")
+    return pattern, variant_to_name
+
+
 class SelectorGroupChatManager(BaseGroupChatManager):
     """A group chat manager that selects the next speaker using a ChatCompletion
     model and a custom selector function."""
@@ -49,6 +67,8 @@ def __init__(
         self._previous_speaker: str | None = None
         self._allow_repeated_speaker = allow_repeated_speaker
         self._selector_func = selector_func
+        # Construct agent roles once, the roster does not change during the group chat.
+        self._roles = self._construct_roles()
 
     async def validate_group_state(self, messages: List[ChatMessage] | None) -> None:
         pass
@@ -70,7 +90,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         selector_state = SelectorManagerState.model_validate(state)
-        self._message_thread = list(selector_state.message_thread)
+        self._message_thread = selector_state.message_thread
         self._current_turn = selector_state.current_turn
         self._previous_speaker = selector_state.previous_speaker
 
@@ -95,30 +115,18 @@ async def select_speaker(self, thread: List[AgentEvent | ChatMessage]) -> str:
                 # Ignore agent events.
                 continue
             # The agent type must be the same as the topic type, which we use as the agent name.
-            message = f"{msg.source}:"
             if isinstance(msg.content, str):
-                message += f" {msg.content}"
+                history_messages.append(f"{msg.source}: {msg.content}")
             elif isinstance(msg, MultiModalMessage):
+                # Join the parts once rather than growing the string item by item.
+                parts = [f"{msg.source}:"]
                 for item in msg.content:
-                    if isinstance(item, str):
-                        message += f" {item}"
-                    else:
-                        message += " [Image]"
+                    parts.append(item if isinstance(item, str) else "[Image]")
+                history_messages.append(" ".join(parts))
             else:
                 raise ValueError(f"Unexpected message type in selector: {type(msg)}")
-            history_messages.append(message)
         history = "\n".join(history_messages)
 
-        # Construct agent roles, we are using the participant topic type as the agent name.
-        roles = "\n".join(
-            [
-                f"{topic_type}: {description}".strip()
-                for topic_type, description in zip(
-                    self._participant_topic_types, self._participant_descriptions, strict=True
-                )
-            ]
-        )
-
         # Construct agent list to be selected, skip the previous speaker if not allowed.
         if self._previous_speaker is not None and not self._allow_repeated_speaker:
             participants = [p for p in self._participant_topic_types if p != self._previous_speaker]
@@ -129,15 +137,16 @@ async def select_speaker(self, thread: List[AgentEvent | ChatMessage]) -> str:
         # Select the next speaker.
         if len(participants) > 1:
             select_speaker_prompt = self._selector_prompt.format(
-                roles=roles, participants=str(participants), history=history
+                roles=self._roles, participants=str(participants), history=history
             )
             select_speaker_messages = [SystemMessage(content=select_speaker_prompt)]
             response = await self._model_client.create(messages=select_speaker_messages)
-            assert isinstance(response.content, str)
+            if not isinstance(response.content, str):
+                raise TypeError(f"Expected the selector model to return text, but got {type(response.content)}")
             mentions = self._mentioned_agents(response.content, self._participant_topic_types)
             if len(mentions) != 1:
                 raise ValueError(f"Expected exactly one agent to be mentioned, but got {mentions}")
-            agent_name = list(mentions.keys())[0]
+            agent_name = next(iter(mentions))
             if (
                 not self._allow_repeated_speaker
                 and self._previous_speaker is not None
@@ -164,24 +173,13 @@ def _mentioned_agents(self, message_content: str, agent_names: List[str]) -> Dic
         Returns:
             Dict: a counter for mentioned agents.
         """
-        mentions: Dict[str, int] = dict()
-        for name in agent_names:
-            # Finds agent mentions, taking word boundaries into account,
-            # accommodates escaping underscores and underscores as spaces
-            regex = (
-                r"(?<=\W)("
-                + re.escape(name)
-                + r"|"
-                + re.escape(name.replace("_", " "))
-                + r"|"
-                + re.escape(name.replace("_", r"\_"))
-                + r")(?=\W)"
-            )
-            # Pad the message to help with matching
-            count = len(re.findall(regex, f" {message_content} "))
-            if count > 0:
-                mentions[name] = count
-        return mentions
+        pattern, variant_to_name = _agent_mention_pattern(tuple(agent_names))
+        # Fast path: the message is just the agent name, possibly quoted or emphasized.
+        name = variant_to_name.get(message_content.strip(" \t\n.'\"`*"))
+        if name is not None:
+            return {name: 1}
+        # Pad the message to help with matching, and scan it once for all agents.
+        return Counter(variant_to_name[match.group(1)] for match in pattern.finditer(f" {message_content} "))
 
 
 class SelectorGroupChat(BaseGroupChat):
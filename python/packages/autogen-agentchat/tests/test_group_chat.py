@@ -791,6 +791,27 @@ def _select_agent(messages: Sequence[AgentEvent | ChatMessage]) -> str | None:
     )
 
 
+@pytest.mark.asyncio
+async def test_selector_group_chat_mentioned_agents() -> None:
+    model_client = ReplayChatCompletionClient(
+        ["The next role is Story writer.", "**Story_writer_2**", "Story\\_writer should go next."],
+    )
+    agent1 = _EchoAgent("Story_writer", description="echo agent 1")
+    agent2 = _EchoAgent("Story_writer_2", description="echo agent 2")
+    agent3 = _EchoAgent("Editor", description="echo agent 3")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        termination_condition=MaxMessageTermination(4),
+        allow_repeated_speaker=True,
+    )
+    result = await team.run(task="task")
+    assert len(result.messages) == 4
+    assert result.messages[1].source == "Story_writer"
+    assert result.messages[2].source == "Story_writer_2"
+    assert result.messages[3].source == "Story_writer"
+
+
 class _HandOffAgent(BaseChatAgent):
     def __init__(self, name: str, description: str, next_agent: str) -> None:
         super().__init__(name, description)
@@ -17,7 +17,8 @@
     MagenticOneGroupChat,
 )
 from autogen_agentchat.teams._group_chat._magentic_one._magentic_one_orchestrator import MagenticOneOrchestrator
-from autogen_core import AgentId, CancellationToken
+from autogen_core import AgentId, CancellationToken, FunctionCall
+from autogen_core.models import CreateResult, RequestUsage
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from utils import FileLogHandler
 
@@ -198,3 +199,62 @@ async def test_magentic_one_group_chat_with_stalls() -> None:
     assert isinstance(result.messages[4].content, str)
     assert result.messages[4].content.startswith("\nWe are working to address the following user request:")
     assert result.stop_reason is not None and result.stop_reason == "test"
+
+
+@pytest.mark.asyncio
+async def test_magentic_one_group_chat_invalid_ledger() -> None:
+    agent_1 = _EchoAgent("agent_1", description="echo agent 1")
+    agent_2 = _EchoAgent("agent_2", description="echo agent 2")
+
+    model_client = ReplayChatCompletionClient(
+        chat_completions=[
+            "No facts",
+            "No plan",
+            # A non-text response is retried.
+            CreateResult(
+                finish_reason="function_calls",
+                content=[FunctionCall(id="1", name="test", arguments="{}")],
+                usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+                cached=False,
+            ),
+            # A non-string next speaker is rejected and retried.
+            json.dumps(
+                {
+                    "is_request_satisfied": {"answer": False, "reason": "test"},
+                    "is_progress_being_made": {"answer": True, "reason": "test"},
+                    "is_in_loop": {"answer": False, "reason": "test"},
+                    "instruction_or_question": {"answer": "Continue task", "reason": "test"},
+                    "next_speaker": {"answer": 1, "reason": "test"},
+                }
+            ),
+            # The string "false" must not finish the task.
+            json.dumps(
+                {
+                    "is_request_satisfied": {"answer": "false", "reason": "test"},
+                    "is_progress_being_made": {"answer": True, "reason": "test"},
+                    "is_in_loop": {"answer": False, "reason": "test"},
+                    "instruction_or_question": {"answer": "Continue task", "reason": "test"},
+                    "next_speaker": {"answer": "agent_1", "reason": "test"},
+                }
+            ),
+            json.dumps(
+                {
+                    "is_request_satisfied": {"answer": True, "reason": "Because"},
+                    "is_progress_being_made": {"answer": True, "reason": "test"},
+                    "is_in_loop": {"answer": False, "reason": "test"},
+                    "instruction_or_question": {"answer": "Task completed", "reason": "Because"},
+                    "next_speaker": {"answer": "agent_1", "reason": "test"},
+                }
+            ),
+            "print('Hello, world!')",
+        ],
+    )
+
+    team = MagenticOneGroupChat(participants=[agent_1, agent_2], model_client=model_client)
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    assert len(result.messages) == 5
+    assert result.messages[2].content == "Continue task"
+    assert result.messages[3].source == "agent_1"
+    assert result.messages[4].content == "print('Hello, world!')"
+    assert result.stop_reason is not None and result.stop_reason == "Because"
+    assert agent_1.total_messages == 1
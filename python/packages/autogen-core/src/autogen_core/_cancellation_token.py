@@ -21,8 +21,8 @@ def cancel(self) -> None:
 
     def is_cancelled(self) -> bool:
         """Check if the CancellationToken has been used"""
-        with self._lock:
-            return self._cancelled
+        # Reading a bool is atomic, the lock is only needed to make cancel and callback registration consistent.
+        return self._cancelled
 
     def add_callback(self, callback: Callable[[], None]) -> None:
         """Attach a callback that will be called when cancel is invoked"""
@@ -23,6 +23,9 @@ class InterventionHandler(Protocol):
     The handler is called when the message is submitted to the runtime.
 
     Currently the only runtime which supports this is the :class:`autogen_core.base.SingleThreadedAgentRuntime`.
+    It never calls intervention handler methods concurrently: :meth:`on_response` runs while the response is
+    being delivered, but not at the same time as any other :meth:`on_send`, :meth:`on_publish` or
+    :meth:`on_response` call.
 
     Note: Returning None from any of the intervention handler methods will result in a warning being issued and treated as "no change". If you intend to drop a message, you should return :class:`DropMessage` explicitly.
 
@@ -1,6 +1,6 @@
-from contextlib import contextmanager
-from contextvars import ContextVar
-from typing import Any, ClassVar, Generator
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import ClassVar
 
 from ._agent_id import AgentId
 
@@ -14,14 +14,9 @@ def __init__(self) -> None:
     _MESSAGE_HANDLER_CONTEXT: ClassVar[ContextVar[AgentId]] = ContextVar("_MESSAGE_HANDLER_CONTEXT")
 
     @classmethod
-    @contextmanager
-    def populate_context(cls, ctx: AgentId) -> Generator[None, Any, None]:
+    def populate_context(cls, ctx: AgentId) -> "_PopulatedMessageHandlerContext":
         """:meta private:"""
-        token = MessageHandlerContext._MESSAGE_HANDLER_CONTEXT.set(ctx)
-        try:
-            yield
-        finally:
-            MessageHandlerContext._MESSAGE_HANDLER_CONTEXT.reset(token)
+        return _PopulatedMessageHandlerContext(ctx)
 
     @classmethod
     def agent_id(cls) -> AgentId:
@@ -29,3 +24,29 @@ def agent_id(cls) -> AgentId:
             return cls._MESSAGE_HANDLER_CONTEXT.get()
         except LookupError as e:
             raise RuntimeError("MessageHandlerContext.agent_id() must be called within a message handler.") from e
+
+
+class _PopulatedMessageHandlerContext:
+    """Sets the message handler context for the duration of a ``with`` block.
+
+    This is entered around every message handler call, so it is a plain class rather than a
+    generator-based context manager to keep the per-call overhead low."""
+
+    __slots__ = ("_ctx", "_token")
+
+    def __init__(self, ctx: AgentId) -> None:
+        self._ctx = ctx
+        self._token: Token[AgentId] | None = None
+
+    def __enter__(self) -> None:
+        self._token = MessageHandlerContext._MESSAGE_HANDLER_CONTEXT.set(self._ctx)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        assert self._token is not None
+        MessageHandlerContext._MESSAGE_HANDLER_CONTEXT.reset(self._token)
+        self._token = None
@@ -151,8 +151,12 @@ def put_nowait(self, item: T) -> None:
             raise asyncio.QueueFull
         self._put(item)
         self._unfinished_tasks += 1
-        self._finished.clear()
-        self._wakeup_next(self._getters)
+        # The event is only set while there are no unfinished tasks, so it only needs
+        # clearing on the first put after the queue drained.
+        if self._unfinished_tasks == 1:
+            self._finished.clear()
+        if self._getters:
+            self._wakeup_next(self._getters)
 
     async def get(self) -> T:
         """Remove and return an item from the queue.
@@ -198,7 +202,8 @@ def get_nowait(self) -> T:
                 raise QueueShutDown
             raise asyncio.QueueEmpty
         item = self._get()
-        self._wakeup_next(self._putters)
+        if self._putters:
+            self._wakeup_next(self._putters)
         return item
 
     def task_done(self) -> None:
@@ -1,5 +1,5 @@
-from collections import defaultdict
-from typing import Awaitable, Callable, DefaultDict, List, Set
+from collections import OrderedDict, defaultdict
+from typing import Awaitable, Callable, DefaultDict, List, Set, Tuple
 
 from ._agent import Agent
 from ._agent_id import AgentId
@@ -7,6 +7,9 @@
 from ._subscription import Subscription
 from ._topic import TopicId
 
+# Maximum number of (topic, excluded agent) recipient lists kept by SubscriptionManager.
+_MAX_CACHED_EXCLUDED_RECIPIENTS = 1024
+
 
 async def get_impl(
     *,
@@ -34,6 +37,9 @@ def __init__(self) -> None:
         self._subscriptions: List[Subscription] = []
         self._seen_topics: Set[TopicId] = set()
         self._subscribed_recipients: DefaultDict[TopicId, List[AgentId]] = defaultdict(list)
+        # (topic, excluded agent) -> recipients, derived from _subscribed_recipients on demand.
+        # Bounded as an LRU, since topic sources are often per session.
+        self._subscribed_recipients_excluding: OrderedDict[Tuple[TopicId, AgentId], List[AgentId]] = OrderedDict()
 
     async def add_subscription(self, subscription: Subscription) -> None:
         # Check if the subscription already exists
@@ -56,14 +62,29 @@ def is_not_sub(x: Subscription) -> bool:
         # Rebuild the subscriptions
         self._rebuild_subscriptions(self._seen_topics)
 
-    async def get_subscribed_recipients(self, topic: TopicId) -> List[AgentId]:
+    async def get_subscribed_recipients(self, topic: TopicId, exclude: AgentId | None = None) -> List[AgentId]:
         if topic not in self._seen_topics:
             self._build_for_new_topic(topic)
-        return self._subscribed_recipients[topic]
+        if exclude is None:
+            return self._subscribed_recipients[topic]
+
+        key = (topic, exclude)
+        cache = self._subscribed_recipients_excluding
+        recipients = cache.get(key)
+        if recipients is not None:
+            cache.move_to_end(key)
+            return recipients
+
+        recipients = [agent_id for agent_id in self._subscribed_recipients[topic] if agent_id != exclude]
+        cache[key] = recipients
+        if len(cache) > _MAX_CACHED_EXCLUDED_RECIPIENTS:
+            cache.popitem(last=False)
+        return recipients
 
     # TODO: optimize this...
     def _rebuild_subscriptions(self, topics: Set[TopicId]) -> None:
         self._subscribed_recipients.clear()
+        self._subscribed_recipients_excluding.clear()
         for topic in topics:
             self._build_for_new_topic(topic)
 
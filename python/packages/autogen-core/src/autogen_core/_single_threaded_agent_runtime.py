@@ -2,6 +2,7 @@
 
 import asyncio
 import inspect
+import itertools
 import logging
 import sys
 import uuid
@@ -9,7 +10,7 @@
 from asyncio import CancelledError, Future, Queue, Task
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, ParamSpec, Set, Type, TypeVar, cast
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Mapping, ParamSpec, Set, Type, TypeVar, cast
 
 from opentelemetry.trace import TracerProvider
 
@@ -49,12 +50,15 @@
 logger = logging.getLogger("autogen_core")
 event_logger = logging.getLogger("autogen_core.events")
 
+# Maximum number of queued messages dispatched per iteration of the processing loop.
+_MAX_MESSAGE_BATCH_SIZE = 32
+
 # We use a type parameter in some functions which shadows the built-in `type` function.
 # This is a workaround to avoid shadowing the built-in `type` function.
 type_func_alias = type
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PublishMessageEnvelope:
     """A message envelope for publishing messages to all agents that can handle
     the message of the type T."""
@@ -67,7 +71,7 @@ class PublishMessageEnvelope:
     message_id: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SendMessageEnvelope:
     """A message envelope for sending a message to a specific agent that can handle
     the message of the type T."""
@@ -81,17 +85,6 @@ class SendMessageEnvelope:
     message_id: str
 
 
-@dataclass(kw_only=True)
-class ResponseMessageEnvelope:
-    """A message envelope for sending a response to a message."""
-
-    message: Any
-    future: Future[Any]
-    sender: AgentId
-    recipient: AgentId | None
-    metadata: EnvelopeMetadata | None = None
-
-
 P = ParamSpec("P")
 T = TypeVar("T", bound=Agent)
 
@@ -147,24 +140,62 @@ def _warn_if_none(value: Any, handler_name: str) -> None:
 
 
 class SingleThreadedAgentRuntime(AgentRuntime):
+    """A single-threaded agent runtime that processes all messages using a single asyncio queue.
+
+    Args:
+        intervention_handlers (List[InterventionHandler], optional): A list of intervention
+            handlers that can intercept messages before they are sent or published. Defaults to None.
+        tracer_provider (TracerProvider, optional): The tracer provider to use for tracing. Defaults to None.
+        eager_message_processing (bool, optional): Whether to start processing each message eagerly,
+            so that handlers that complete without suspending never wait for an event loop iteration.
+            Requires Python 3.12 or later and is ignored on earlier versions. Defaults to False.
+        serial_processing (bool, optional): Whether to process each message to completion before taking
+            the next one off the queue, instead of running message handlers concurrently in background tasks.
+            This avoids creating a task per message, but a handler that awaits
+            :meth:`send_message` will deadlock the runtime, so only enable it when handlers do not
+            wait on other agents. For the same reason, handlers must not call :meth:`stop_when_idle`
+            or :meth:`stop`, which wait for the message loop that is running the handler.
+            Defaults to False.
+    """
+
     def __init__(
         self,
         *,
         intervention_handlers: List[InterventionHandler] | None = None,
         tracer_provider: TracerProvider | None = None,
+        eager_message_processing: bool = False,
+        serial_processing: bool = False,
     ) -> None:
         self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("SingleThreadedAgentRuntime"))
-        self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope] = Queue()
+        self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope] = Queue()
         # (namespace, type) -> List[AgentId]
-        self._agent_factories: Dict[
-            str, Callable[[], Agent | Awaitable[Agent]] | Callable[[AgentRuntime, AgentId], Agent | Awaitable[Agent]]
-        ] = {}
+        # Agent factories are stored wrapped by register_factory, so they always take no arguments.
+        self._agent_factories: Dict[str, Callable[[], Agent | Awaitable[Agent]]] = {}
         self._instantiated_agents: Dict[AgentId, Agent] = {}
         self._intervention_handlers = intervention_handlers
+        # Intervention handlers are never called concurrently, including on_response calls made
+        # from the background tasks that process direct messages.
+        self._intervention_lock = asyncio.Lock()
         self._background_tasks: Set[Task[Any]] = set()
+        # Bound once and shared as the done callback of every background task.
+        self._discard_background_task = self._background_tasks.discard
+        self._eager_message_processing = eager_message_processing
+        self._serial_processing = serial_processing
+        # Generated message ids are a per-runtime random prefix plus a counter, so that ids stay unique
+        # across runtimes and processes without drawing a fresh random UUID for every message.
+        self._message_id_prefix = uuid.uuid4().hex
+        self._message_id_sequence = itertools.count()
         self._subscription_manager = SubscriptionManager()
         self._run_context: RunContext | None = None
         self._serialization_registry = SerializationRegistry()
+        self._message_dispatchers: Dict[Type[Any], Callable[[Any], Awaitable[None]]] = {
+            SendMessageEnvelope: self._dispatch_send,
+            PublishMessageEnvelope: self._dispatch_publish,
+        }
+        self._message_processors: Dict[Type[Any], Callable[[Any], Coroutine[Any, Any, None]]] = {
+            SendMessageEnvelope: self._process_send,
+            PublishMessageEnvelope: self._process_publish,
+        }
 
     @property
     def unprocessed_messages_count(
@@ -172,9 +203,8 @@ def unprocessed_messages_count(
     ) -> int:
         return self._message_queue.qsize()
 
-    @property
-    def _known_agent_names(self) -> Set[str]:
-        return set(self._agent_factories.keys())
+    def _next_message_id(self) -> str:
+        return f"{self._message_id_prefix}-{next(self._message_id_sequence)}"
 
     # Returns the response of the message
     async def send_message(
@@ -190,30 +220,33 @@ async def send_message(
             cancellation_token = CancellationToken()
 
         if message_id is None:
-            message_id = str(uuid.uuid4())
-
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+            message_id = self._next_message_id()
+
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                MessageEvent(
+                    payload=self._try_serialize(message),
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
+        message_type = type(message).__name__
         with self._tracer_helper.trace_block(
             "create",
             recipient,
             parent=None,
-            extraAttributes={"message_type": type(message).__name__},
+            extraAttributes={"message_type": message_type},
         ):
-            future = asyncio.get_event_loop().create_future()
-            if recipient.type not in self._known_agent_names:
+            future = asyncio.get_running_loop().create_future()
+            if recipient.type not in self._agent_factories:
                 future.set_exception(Exception("Recipient not found"))
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Sending message of type {message_type} to {recipient.type}: {content}")
 
             await self._message_queue.put(
                 SendMessageEnvelope(
@@ -240,29 +273,32 @@ async def publish_message(
         cancellation_token: CancellationToken | None = None,
         message_id: str | None = None,
     ) -> None:
+        message_type = type(message).__name__
         with self._tracer_helper.trace_block(
             "create",
             topic_id,
             parent=None,
-            extraAttributes={"message_type": type(message).__name__},
+            extraAttributes={"message_type": message_type},
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Publishing message of type {message_type} to all subscribers: {content}")
 
             if message_id is None:
-                message_id = str(uuid.uuid4())
+                message_id = self._next_message_id()
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize(message),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 PublishMessageEnvelope(
@@ -284,30 +320,35 @@ async def save_state(self) -> Mapping[str, Any]:
     async def load_state(self, state: Mapping[str, Any]) -> None:
         for agent_id_str in state:
             agent_id = AgentId.from_str(agent_id_str)
-            if agent_id.type in self._known_agent_names:
+            if agent_id.type in self._agent_factories:
                 await (await self._get_agent(agent_id)).load_state(state[str(agent_id)])
 
     async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
+        # Keep the queue the message was taken from: stopping the runtime replaces
+        # self._message_queue while messages already taken may still be processing.
+        message_queue = self._message_queue
         with self._tracer_helper.trace_block("send", message_envelope.recipient, parent=message_envelope.metadata):
             recipient = message_envelope.recipient
 
-            if recipient.type not in self._known_agent_names:
-                raise LookupError(f"Agent type '{recipient.type}' does not exist.")
-
             try:
-                sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
-                logger.info(
-                    f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
-                )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                if recipient.type not in self._agent_factories:
+                    raise LookupError(f"Agent type '{recipient.type}' does not exist.")
+
+                if logger.isEnabledFor(logging.INFO):
+                    sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
+                    logger.info(
+                        f"Calling message handler for {recipient} with message type {type(message_envelope.message).__name__} sent by {sender_id}"
+                    )
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageEvent(
+                            payload=self._try_serialize(message_envelope.message),
+                            sender=message_envelope.sender,
+                            receiver=recipient,
+                            kind=MessageKind.DIRECT,
+                            delivery_stage=DeliveryStage.DELIVER,
+                        )
                     )
-                )
                 recipient_agent = await self._get_agent(recipient)
 
                 message_context = MessageContext(
@@ -325,7 +366,7 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
             except CancelledError as e:
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
-                self._message_queue.task_done()
+                message_queue.task_done()
                 event_logger.info(
                     MessageHandlerExceptionEvent(
                         payload=self._try_serialize(message_envelope.message),
@@ -335,8 +376,10 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                 )
                 return
             except BaseException as e:
-                message_envelope.future.set_exception(e)
-                self._message_queue.task_done()
+                # The future may already be resolved, e.g. send_message fails it for unknown recipients.
+                if not message_envelope.future.done():
+                    message_envelope.future.set_exception(e)
+                message_queue.task_done()
                 event_logger.info(
                     MessageHandlerExceptionEvent(
                         payload=self._try_serialize(message_envelope.message),
@@ -346,53 +389,76 @@ async def _process_send(self, message_envelope: SendMessageEnvelope) -> None:
                 )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize(response),
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
-            await self._message_queue.put(
-                ResponseMessageEnvelope(
-                    message=response,
-                    future=message_envelope.future,
-                    sender=message_envelope.recipient,
-                    recipient=message_envelope.sender,
-                    metadata=get_telemetry_envelope_metadata(),
-                )
-            )
-            self._message_queue.task_done()
+            # Resolve the response directly rather than re-queuing it.
+            await self._process_response(response, message_envelope)
+            message_queue.task_done()
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
+        # See _process_send.
+        message_queue = self._message_queue
         with self._tracer_helper.trace_block("publish", message_envelope.topic_id, parent=message_envelope.metadata):
             try:
+                # Avoid sending the message back to the sender
+                recipients = await self._subscription_manager.get_subscribed_recipients(
+                    message_envelope.topic_id, exclude=message_envelope.sender
+                )
+                sender_agent = (
+                    await self._get_agent(message_envelope.sender)
+                    if recipients and message_envelope.sender is not None
+                    else None
+                )
+                sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
+
+                # Resolve all recipients before dispatching to any of them. This is done in order, not
+                # concurrently, so that instantiating agents never yields to other queued messages.
+                agents = [await self._get_agent(agent_id) for agent_id in recipients]
+
+                async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
+                    with self._tracer_helper.trace_block("process", agent.id, parent=None):
+                        with MessageHandlerContext.populate_context(agent.id):
+                            try:
+                                return await agent.on_message(
+                                    message_envelope.message,
+                                    ctx=message_context,
+                                )
+                            except BaseException as e:
+                                logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
+                                event_logger.info(
+                                    MessageHandlerExceptionEvent(
+                                        payload=self._try_serialize(message_envelope.message),
+                                        handling_agent=agent.id,
+                                        exception=e,
+                                    )
+                                )
+                                raise
+
                 responses: List[Awaitable[Any]] = []
-                recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
-                for agent_id in recipients:
-                    # Avoid sending the message back to the sender
-                    if message_envelope.sender is not None and agent_id == message_envelope.sender:
-                        continue
-
-                    sender_agent = (
-                        await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
-                    )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
-                    )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
-                            sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
+                for agent in agents:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            f"Calling message handler for {agent.id.type} with message type {type(message_envelope.message).__name__} published by {sender_name}"
+                        )
+                    if event_logger.isEnabledFor(logging.INFO):
+                        event_logger.info(
+                            MessageEvent(
+                                payload=self._try_serialize(message_envelope.message),
+                                sender=message_envelope.sender,
+                                receiver=None,
+                                kind=MessageKind.PUBLISH,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
                         )
-                    )
                     message_context = MessageContext(
                         sender=message_envelope.sender,
                         topic_id=message_envelope.topic_id,
@@ -400,158 +466,135 @@ async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> No
                         cancellation_token=message_envelope.cancellation_token,
                         message_id=message_envelope.message_id,
                     )
-                    agent = await self._get_agent(agent_id)
-
-                    async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
-                        with self._tracer_helper.trace_block("process", agent.id, parent=None):
-                            with MessageHandlerContext.populate_context(agent.id):
-                                try:
-                                    return await agent.on_message(
-                                        message_envelope.message,
-                                        ctx=message_context,
-                                    )
-                                except BaseException as e:
-                                    logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
-                                    event_logger.info(
-                                        MessageHandlerExceptionEvent(
-                                            payload=self._try_serialize(message_envelope.message),
-                                            handling_agent=agent.id,
-                                            exception=e,
-                                        )
-                                    )
-                                    raise
-
-                    future = _on_message(agent, message_context)
-                    responses.append(future)
+                    responses.append(_on_message(agent, message_context))
 
                 await asyncio.gather(*responses)
             except BaseException:
                 # Ignore exceptions raised during publishing. We've already logged them above.
                 pass
             finally:
-                self._message_queue.task_done()
+                message_queue.task_done()
             # TODO if responses are given for a publish
 
-    async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
-        with self._tracer_helper.trace_block("ack", message_envelope.recipient, parent=message_envelope.metadata):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient {message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+    async def _process_response(self, response: Any, message_envelope: SendMessageEnvelope) -> None:
+        sender = message_envelope.recipient
+        recipient = message_envelope.sender
+        future = message_envelope.future
+        if self._intervention_handlers:
+            async with self._intervention_lock:
+                for handler in self._intervention_handlers:
+                    try:
+                        temp_message = await handler.on_response(response, sender=sender, recipient=recipient)
+                        _warn_if_none(temp_message, "on_response")
+                    except BaseException as e:
+                        # TODO: should we raise the exception to sender of the response instead?
+                        if not future.cancelled():
+                            future.set_exception(e)
+                        return
+                    if temp_message is DropMessage or isinstance(temp_message, DropMessage):
+                        event_logger.info(
+                            MessageDroppedEvent(
+                                payload=self._try_serialize(response),
+                                sender=sender,
+                                receiver=recipient,
+                                kind=MessageKind.RESPOND,
+                            )
+                        )
+                        if not future.cancelled():
+                            future.set_exception(MessageDroppedException())
+                        return
+                    response = temp_message
+
+        # The ack span is nested under the current send span.
+        with self._tracer_helper.trace_block("ack", recipient, parent=None):
+            if logger.isEnabledFor(logging.INFO):
+                content = response.__dict__ if hasattr(response, "__dict__") else response
+                logger.info(
+                    f"Resolving response with message type {type(response).__name__} for recipient {recipient} from {sender.type}: {content}"
                 )
-            )
-            if not message_envelope.future.cancelled():
-                message_envelope.future.set_result(message_envelope.message)
-            self._message_queue.task_done()
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize(response),
+                        sender=sender,
+                        receiver=recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
+                )
+            if not future.cancelled():
+                future.set_result(response)
 
     @deprecated("Manually stepping the runtime processing is deprecated. Use start() instead.")
     async def process_next(self) -> None:
-        await self._process_next()
-
-    async def _process_next(self) -> None:
         """Process the next message in the queue."""
+        await self._process_next(max_batch_size=1)
+
+    async def _process_next(self, max_batch_size: int = _MAX_MESSAGE_BATCH_SIZE) -> None:
+        """Process the next batch of messages in the queue.
+
+        Waits for one message, then processes up to ``max_batch_size`` messages in total that
+        are already queued, before yielding control to the event loop once.
 
+        Messages that need intervention handlers or serial processing are taken off the queue
+        one at a time, after the previous one has been dispatched, so that :meth:`stop` discards
+        everything after the message being dispatched. Otherwise the whole batch is taken and
+        scheduled at once, without yielding in between."""
+
+        # Bind the attributes used per message once per batch.
+        message_queue = self._message_queue
         try:
-            message_envelope = await self._message_queue.get()
+            message_envelope = await message_queue.get()
         except QueueShutDown:
             return
 
-        match message_envelope:
-            case SendMessageEnvelope(message=message, sender=sender, recipient=recipient, future=future):
-                if self._intervention_handlers is not None:
-                    for handler in self._intervention_handlers:
-                        with self._tracer_helper.trace_block(
-                            "intercept", handler.__class__.__name__, parent=message_envelope.metadata
-                        ):
-                            try:
-                                message_context = MessageContext(
-                                    sender=sender,
-                                    topic_id=None,
-                                    is_rpc=True,
-                                    cancellation_token=message_envelope.cancellation_token,
-                                    message_id=message_envelope.message_id,
-                                )
-                                temp_message = await handler.on_send(
-                                    message, message_context=message_context, recipient=recipient
-                                )
-                                _warn_if_none(temp_message, "on_send")
-                            except BaseException as e:
-                                future.set_exception(e)
-                                return
-                            if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=recipient,
-                                        kind=MessageKind.DIRECT,
-                                    )
-                                )
-                                future.set_exception(MessageDroppedException())
-                                return
-
-                        message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_send(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
-            case PublishMessageEnvelope(
-                message=message,
-                sender=sender,
-                topic_id=topic_id,
-            ):
-                if self._intervention_handlers is not None:
-                    for handler in self._intervention_handlers:
-                        with self._tracer_helper.trace_block(
-                            "intercept", handler.__class__.__name__, parent=message_envelope.metadata
-                        ):
-                            try:
-                                message_context = MessageContext(
-                                    sender=sender,
-                                    topic_id=topic_id,
-                                    is_rpc=False,
-                                    cancellation_token=message_envelope.cancellation_token,
-                                    message_id=message_envelope.message_id,
-                                )
-                                temp_message = await handler.on_publish(message, message_context=message_context)
-                                _warn_if_none(temp_message, "on_publish")
-                            except BaseException as e:
-                                # TODO: we should raise the intervention exception to the publisher.
-                                logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
-                                return
-                            if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=topic_id,
-                                        kind=MessageKind.PUBLISH,
-                                    )
-                                )
-                                return
-
-                        message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_publish(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
-            case ResponseMessageEnvelope(message=message, sender=sender, recipient=recipient, future=future):
-                if self._intervention_handlers is not None:
-                    for handler in self._intervention_handlers:
+        if self._intervention_handlers or self._serial_processing:
+            dispatchers = self._message_dispatchers
+            await dispatchers[type(message_envelope)](message_envelope)
+            processed = 1
+            # stop() empties the queue, which ends the batch.
+            while processed < max_batch_size and not message_queue.empty():
+                message_envelope = message_queue.get_nowait()
+                await dispatchers[type(message_envelope)](message_envelope)
+                processed += 1
+        else:
+            # Nothing to run before processing, so schedule each message directly.
+            message_envelopes = [message_envelope]
+            while len(message_envelopes) < max_batch_size and not message_queue.empty():
+                message_envelopes.append(message_queue.get_nowait())
+            processors = self._message_processors
+            create_background_task = self._create_background_task
+            for message_envelope in message_envelopes:
+                create_background_task(processors[type(message_envelope)](message_envelope))
+
+        # Yield control to the message loop to allow other tasks to run
+        await asyncio.sleep(0)
+
+    async def _dispatch_send(self, message_envelope: SendMessageEnvelope) -> None:
+        """Run the intervention handlers on a direct message and schedule its processing."""
+        message = message_envelope.message
+        sender = message_envelope.sender
+        recipient = message_envelope.recipient
+        future = message_envelope.future
+        if self._intervention_handlers:
+            async with self._intervention_lock:
+                for handler in self._intervention_handlers:
+                    with self._tracer_helper.trace_block(
+                        "intercept", handler.__class__.__name__, parent=message_envelope.metadata
+                    ):
                         try:
-                            temp_message = await handler.on_response(message, sender=sender, recipient=recipient)
-                            _warn_if_none(temp_message, "on_response")
+                            message_context = MessageContext(
+                                sender=sender,
+                                topic_id=None,
+                                is_rpc=True,
+                                cancellation_token=message_envelope.cancellation_token,
+                                message_id=message_envelope.message_id,
+                            )
+                            temp_message = await handler.on_send(
+                                message, message_context=message_context, recipient=recipient
+                            )
+                            _warn_if_none(temp_message, "on_send")
                         except BaseException as e:
-                            # TODO: should we raise the exception to sender of the response instead?
                             future.set_exception(e)
                             return
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
@@ -560,18 +603,71 @@ async def _process_next(self) -> None:
                                     payload=self._try_serialize(message),
                                     sender=sender,
                                     receiver=recipient,
-                                    kind=MessageKind.RESPOND,
+                                    kind=MessageKind.DIRECT,
                                 )
                             )
                             future.set_exception(MessageDroppedException())
                             return
-                        message_envelope.message = temp_message
-                task = asyncio.create_task(self._process_response(message_envelope))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._background_tasks.discard)
 
-        # Yield control to the message loop to allow other tasks to run
-        await asyncio.sleep(0)
+                    message_envelope.message = temp_message
+        if self._serial_processing:
+            await self._process_send(message_envelope)
+        else:
+            self._create_background_task(self._process_send(message_envelope))
+
+    async def _dispatch_publish(self, message_envelope: PublishMessageEnvelope) -> None:
+        """Run the intervention handlers on a published message and schedule its processing."""
+        message = message_envelope.message
+        sender = message_envelope.sender
+        topic_id = message_envelope.topic_id
+        if self._intervention_handlers:
+            async with self._intervention_lock:
+                for handler in self._intervention_handlers:
+                    with self._tracer_helper.trace_block(
+                        "intercept", handler.__class__.__name__, parent=message_envelope.metadata
+                    ):
+                        try:
+                            message_context = MessageContext(
+                                sender=sender,
+                                topic_id=topic_id,
+                                is_rpc=False,
+                                cancellation_token=message_envelope.cancellation_token,
+                                message_id=message_envelope.message_id,
+                            )
+                            temp_message = await handler.on_publish(message, message_context=message_context)
+                            _warn_if_none(temp_message, "on_publish")
+                        except BaseException as e:
+                            # TODO: we should raise the intervention exception to the publisher.
+                            logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
+                            return
+                        if temp_message is DropMessage or isinstance(temp_message, DropMessage):
+                            event_logger.info(
+                                MessageDroppedEvent(
+                                    payload=self._try_serialize(message),
+                                    sender=sender,
+                                    receiver=topic_id,
+                                    kind=MessageKind.PUBLISH,
+                                )
+                            )
+                            return
+
+                    message_envelope.message = temp_message
+        if self._serial_processing:
+            await self._process_publish(message_envelope)
+        else:
+            self._create_background_task(self._process_publish(message_envelope))
+
+    def _create_background_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Schedule a message processing coroutine and keep a reference to it until it is done."""
+        if sys.version_info >= (3, 12) and self._eager_message_processing:
+            task = asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+            if task.done():
+                # Completed eagerly, so there is nothing left to keep alive.
+                return
+        else:
+            task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._discard_background_task)
 
     def start(self) -> None:
         """Start the runtime message processing loop. This runs in a background task.
@@ -585,6 +681,13 @@ def start(self) -> None:
             runtime = SingleThreadedAgentRuntime()
             runtime.start()
 
+        .. note::
+
+            The message processing loop runs on the event loop that is running when
+            the runtime is started, and the runtime never changes the global event loop policy.
+            To use a faster event loop implementation such as `uvloop <https://github.com/MagicStack/uvloop>`_,
+            run the application on it, for example with ``uvloop.run(main())``.
+
         """
         if self._run_context is not None:
             raise RuntimeError("Runtime is already started")
@@ -601,13 +704,24 @@ async def close(self) -> None:
             await agent.close()
 
     async def stop(self) -> None:
-        """Immediately stop the runtime message processing loop. The currently processing message will be completed, but all others following it will be discarded."""
+        """Immediately stop the runtime message processing loop. Messages that the loop has already taken off the queue will be completed, but all others following them will be discarded.
+
+        The loop takes a bounded batch of already queued messages before it yields to the event loop,
+        so a whole batch of messages may be completed after :meth:`stop` is called. When intervention handlers
+        are registered or serial processing is on, messages are taken one at a time, and the rest of
+        the batch is discarded as soon as a message handler or intervention handler yields."""
         if self._run_context is None:
             raise RuntimeError("Runtime is not started")
 
         await self._run_context.stop()
+        self._reset_after_stop()
+
+    def _reset_after_stop(self) -> None:
         self._run_context = None
+        # The stopped queue is shut down and bound to the event loop it ran on, so a fresh one
+        # is needed for the runtime to be started again, possibly on a different loop.
         self._message_queue = Queue()
+        self._intervention_lock = asyncio.Lock()
 
     async def stop_when_idle(self) -> None:
         """Stop the runtime message processing loop when there is
@@ -616,8 +730,7 @@ async def stop_when_idle(self) -> None:
             raise RuntimeError("Runtime is not started")
         await self._run_context.stop_when_idle()
 
-        self._run_context = None
-        self._message_queue = Queue()
+        self._reset_after_stop()
 
     async def stop_when(self, condition: Callable[[], bool]) -> None:
         """Stop the runtime message processing loop when the condition is met.
@@ -637,8 +750,7 @@ async def stop_when(self, condition: Callable[[], bool]) -> None:
             raise RuntimeError("Runtime is not started")
         await self._run_context.stop_when(condition)
 
-        self._run_context = None
-        self._message_queue = Queue()
+        self._reset_after_stop()
 
     async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
         return (await self._get_agent(agent)).metadata
@@ -680,24 +792,12 @@ async def factory_wrapper() -> T:
 
     async def _invoke_agent_factory(
         self,
-        agent_factory: Callable[[], T | Awaitable[T]] | Callable[[AgentRuntime, AgentId], T | Awaitable[T]],
+        agent_factory: Callable[[], T | Awaitable[T]],
         agent_id: AgentId,
     ) -> T:
         with AgentInstantiationContext.populate_context((self, agent_id)):
             try:
-                if len(inspect.signature(agent_factory).parameters) == 0:
-                    factory_one = cast(Callable[[], T], agent_factory)
-                    agent = factory_one()
-                elif len(inspect.signature(agent_factory).parameters) == 2:
-                    warnings.warn(
-                        "Agent factories that take two arguments are deprecated. Use AgentInstantiationContext instead. Two arg factories will be removed in a future version.",
-                        stacklevel=2,
-                    )
-                    factory_two = cast(Callable[[AgentRuntime, AgentId], T], agent_factory)
-                    agent = factory_two(self, agent_id)
-                else:
-                    raise ValueError("Agent factory must take 0 or 2 arguments.")
-
+                agent = agent_factory()
                 if inspect.isawaitable(agent):
                     return cast(T, await agent)
 
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 import pytest
@@ -101,7 +102,8 @@ async def on_response(
     with pytest.raises(MessageDroppedException):
         _response = await runtime.send_message(MessageType(), recipient=loopback)
 
-    await runtime.stop()
+    # The dropped response must not leave an unfinished message in the queue.
+    await runtime.stop_when_idle()
 
 
 @pytest.mark.asyncio
@@ -155,3 +157,54 @@ async def on_response(
 
     long_running_agent = await runtime.try_get_underlying_agent_instance(loopback, type=LoopbackAgent)
     assert long_running_agent.num_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_intervention_replace_response() -> None:
+    class ReplaceResponseInterventionHandler(DefaultInterventionHandler):
+        async def on_response(self, message: Any, *, sender: AgentId, recipient: AgentId | None) -> Any:
+            return "replaced"
+
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[ReplaceResponseInterventionHandler()])
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+    runtime.start()
+
+    response = await runtime.send_message(MessageType(), recipient=AgentId("name", key="default"))
+    assert response == "replaced"
+
+    await runtime.stop_when_idle()
+
+
+@pytest.mark.asyncio
+async def test_intervention_handlers_not_called_concurrently() -> None:
+    class ConcurrencyTrackingInterventionHandler(DefaultInterventionHandler):
+        def __init__(self) -> None:
+            self.active = 0
+            self.max_active = 0
+
+        async def _track(self, message: Any) -> Any:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            # Suspend so that any other intervention call could interleave here.
+            await asyncio.sleep(0)
+            self.active -= 1
+            return message
+
+        async def on_send(self, message: Any, *, message_context: MessageContext, recipient: AgentId) -> Any:
+            return await self._track(message)
+
+        async def on_response(self, message: Any, *, sender: AgentId, recipient: AgentId | None) -> Any:
+            return await self._track(message)
+
+    handler = ConcurrencyTrackingInterventionHandler()
+    runtime = SingleThreadedAgentRuntime(intervention_handlers=[handler])
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+    runtime.start()
+
+    responses = await asyncio.gather(
+        *(runtime.send_message(MessageType(), recipient=AgentId("name", key=str(i))) for i in range(5))
+    )
+    assert responses == [MessageType()] * 5
+    assert handler.max_active == 1
+
+    await runtime.stop_when_idle()
@@ -1,17 +1,23 @@
+import asyncio
 import logging
+import sys
+from typing import Any, List
 
 import pytest
 from autogen_core import (
     AgentId,
     AgentInstantiationContext,
     AgentType,
+    BaseAgent,
     DefaultTopicId,
+    MessageContext,
     SingleThreadedAgentRuntime,
     TopicId,
     TypeSubscription,
     try_get_known_serializers_for_type,
     type_subscription,
 )
+from autogen_core._single_threaded_agent_runtime import _MAX_MESSAGE_BATCH_SIZE  # pyright: ignore[reportPrivateUsage]
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -26,6 +32,16 @@
 test_exporter = MyTestExporter()
 
 
+class MessageIdRecordingAgent(BaseAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that records the ids of the messages it receives.")
+        self.message_ids: List[str] = []
+
+    async def on_message_impl(self, message: Any, ctx: MessageContext) -> Any:
+        self.message_ids.append(ctx.message_id)
+        return message
+
+
 @pytest.fixture
 def tracer_provider() -> TracerProvider:
     test_exporter.clear()
@@ -243,3 +259,125 @@ async def test_default_subscription_publish_to_other_source() -> None:
     assert other_long_running_agent.num_calls == 1
 
     await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_eager_message_processing() -> None:
+    runtime = SingleThreadedAgentRuntime(eager_message_processing=True)
+    runtime.start()
+
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    agent_id = AgentId("name", key="default")
+    response = await runtime.send_message(MessageType(), recipient=agent_id)
+    assert response == MessageType()
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+
+    long_running_agent = await runtime.try_get_underlying_agent_instance(
+        agent_id, type=LoopbackAgentWithDefaultSubscription
+    )
+    assert long_running_agent.num_calls == 2
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks require Python 3.12+.")
+async def test_eager_message_processing_skips_completed_tasks() -> None:
+    runtime = SingleThreadedAgentRuntime(eager_message_processing=True)
+    runtime.start()
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+
+    # The handler never suspends, so its task finishes before it could be tracked.
+    response = await runtime.send_message(MessageType(), recipient=AgentId("name", key="default"))
+    assert response == MessageType()
+    assert not runtime._background_tasks  # pyright: ignore[reportPrivateUsage]
+
+    await runtime.stop()
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_serial_processing() -> None:
+    runtime = SingleThreadedAgentRuntime(serial_processing=True)
+    runtime.start()
+
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    agent_id = AgentId("name", key="default")
+    response = await runtime.send_message(MessageType(), recipient=agent_id)
+    assert response == MessageType()
+    for _ in range(10):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+
+    long_running_agent = await runtime.try_get_underlying_agent_instance(
+        agent_id, type=LoopbackAgentWithDefaultSubscription
+    )
+    assert long_running_agent.num_calls == 11
+
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_serial_processing_unknown_recipient() -> None:
+    runtime = SingleThreadedAgentRuntime(serial_processing=True)
+    await LoopbackAgent.register(runtime, "name", LoopbackAgent)
+    runtime.start()
+
+    # A failed delivery must not stop the message loop.
+    with pytest.raises(Exception, match="Recipient not found"):
+        await runtime.send_message(MessageType(), recipient=AgentId("unknown", key="default"))
+    response = await runtime.send_message(MessageType(), recipient=AgentId("name", key="default"))
+    assert response == MessageType()
+
+    await runtime.stop_when_idle()
+
+
+@pytest.mark.asyncio
+async def test_stop_completes_taken_batch_only() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+    for _ in range(_MAX_MESSAGE_BATCH_SIZE + 8):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+
+    runtime.start()
+    # Let the loop take its first batch, then stop before it takes another.
+    await asyncio.sleep(0)
+    await runtime.stop()
+
+    agent = await runtime.try_get_underlying_agent_instance(
+        AgentId("name", key="default"), type=LoopbackAgentWithDefaultSubscription
+    )
+    assert agent.num_calls == _MAX_MESSAGE_BATCH_SIZE
+
+
+@pytest.mark.asyncio
+async def test_process_next_steps_one_message() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+    for _ in range(3):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+
+    with pytest.warns(DeprecationWarning):
+        await runtime.process_next()
+    assert runtime.unprocessed_messages_count == 2
+
+
+@pytest.mark.asyncio
+async def test_message_ids_unique_across_runtimes() -> None:
+    message_ids: List[str] = []
+    for _ in range(2):
+        runtime = SingleThreadedAgentRuntime()
+        await MessageIdRecordingAgent.register(runtime, "name", MessageIdRecordingAgent)
+        runtime.start()
+        agent_id = AgentId("name", key="default")
+        await runtime.send_message(MessageType(), recipient=agent_id)
+        await runtime.stop_when_idle()
+        agent = await runtime.try_get_underlying_agent_instance(agent_id, type=MessageIdRecordingAgent)
+        message_ids.extend(agent.message_ids)
+        await runtime.close()
+
+    assert len(message_ids) == 2
+    assert message_ids[0] != message_ids[1]
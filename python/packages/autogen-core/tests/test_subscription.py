@@ -7,6 +7,8 @@
     TopicId,
     TypeSubscription,
 )
+from autogen_core import _runtime_impl_helpers as runtime_impl_helpers
+from autogen_core._runtime_impl_helpers import SubscriptionManager
 from autogen_core.exceptions import CantHandleException
 from autogen_test_utils import LoopbackAgent, MessageType
 
@@ -120,3 +122,43 @@ async def test_subscription_deduplication() -> None:
     default_subscription = DefaultSubscription(agent_type=agent_type)
     with pytest.raises(ValueError, match="Subscription already exists"):
         await runtime.add_subscription(default_subscription)
+
+
+@pytest.mark.asyncio
+async def test_subscribed_recipients_exclude() -> None:
+    manager = SubscriptionManager()
+    topic_id = TopicId(type="t1", source="s1")
+    await manager.add_subscription(TypeSubscription(topic_type="t1", agent_type="a1"))
+    await manager.add_subscription(TypeSubscription(topic_type="t1", agent_type="a2"))
+
+    a1 = AgentId(type="a1", key="s1")
+    a2 = AgentId(type="a2", key="s1")
+    assert await manager.get_subscribed_recipients(topic_id) == [a1, a2]
+    assert await manager.get_subscribed_recipients(topic_id, exclude=a1) == [a2]
+
+    # The cached recipients are invalidated when subscriptions change.
+    sub = TypeSubscription(topic_type="t1", agent_type="a3")
+    await manager.add_subscription(sub)
+    a3 = AgentId(type="a3", key="s1")
+    assert await manager.get_subscribed_recipients(topic_id, exclude=a1) == [a2, a3]
+    await manager.remove_subscription(sub.id)
+    assert await manager.get_subscribed_recipients(topic_id, exclude=a1) == [a2]
+
+
+@pytest.mark.asyncio
+async def test_subscribed_recipients_exclude_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runtime_impl_helpers, "_MAX_CACHED_EXCLUDED_RECIPIENTS", 2)
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription(topic_type="t1", agent_type="a1"))
+
+    for source in ["s1", "s2", "s3"]:
+        topic_id = TopicId(type="t1", source=source)
+        assert await manager.get_subscribed_recipients(topic_id, exclude=AgentId(type="other", key=source)) == [
+            AgentId(type="a1", key=source)
+        ]
+
+    # Only the most recently used entries are kept.
+    assert list(manager._subscribed_recipients_excluding) == [  # pyright: ignore[reportPrivateUsage]
+        (TopicId(type="t1", source="s2"), AgentId(type="other", key="s2")),
+        (TopicId(type="t1", source="s3"), AgentId(type="other", key="s3")),
+    ]